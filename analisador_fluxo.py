@@ -0,0 +1,613 @@
+import heapq
+from typing import List, Tuple, Optional, Dict, Any
+from analisador_lexer import AnalisadorLexico
+from leitor_programa import LeitorPrograma, Declaracao, variaveis_lidas, valor_logico_constante
+
+# Instrução de um bloco básico: (tipo, destino, usos, linha, coluna)
+#   tipo:    'param' | 'indef' | 'atrib' | 'cond' | 'retorno'
+#   destino: ID (tabela de símbolos) da variável definida, ou 0 se não define nada
+#   usos:    bitset das variáveis lidas (bit i <-> ID i da tabela de símbolos)
+Instrucao = Tuple[str, int, int, int, int]
+
+
+def bits(valor: int):
+    """Itera pelos índices dos bits ligados de um bitset, do menor para o maior."""
+    while valor:
+        menor = valor & -valor
+        yield menor.bit_length() - 1
+        valor ^= menor
+
+
+class BlocoBasico:
+    def __init__(self, indice: int, rotulo: str):
+        self.indice = indice
+        self.rotulo = rotulo
+        self.instrucoes: List[Instrucao] = []
+        self.sucessores: List[int] = []
+        self.predecessores: List[int] = []
+
+
+class GrafoFluxo:
+    """Grafo de fluxo de controle (CFG) de uma função."""
+
+    def __init__(self, nome: str, linha: int, coluna: int):
+        self.nome = nome
+        self.linha = linha
+        self.coluna = coluna
+        self.blocos: List[BlocoBasico] = []
+        self.entrada = self.novo_bloco('entrada')
+        self.saida = self.novo_bloco('saida')
+        self.parametros = 0  # bitset
+        self.locais = 0      # bitset
+        self.globais = 0     # bitset
+        # Laços encontrados: (cabecalho, saida_do_laco, ultimo_bloco, tipo, linha, coluna).
+        # Os blocos do laço ocupam os índices contíguos [cabecalho, ultimo_bloco].
+        self.lacos: List[Tuple[int, int, int, str, int, int]] = []
+
+    def novo_bloco(self, rotulo: str) -> int:
+        indice = len(self.blocos)
+        self.blocos.append(BlocoBasico(indice, rotulo))
+        return indice
+
+    def ligar(self, origem: Optional[int], destino: int):
+        """Cria a aresta origem -> destino (origem None indica código que não continua)."""
+        if origem is None:
+            return
+        self.blocos[origem].sucessores.append(destino)
+        self.blocos[destino].predecessores.append(origem)
+
+    def adicionar(self, bloco: int, instrucao: Instrucao):
+        self.blocos[bloco].instrucoes.append(instrucao)
+
+
+class ConstrutorCFG(LeitorPrograma):
+    """
+    Percorre os tokens seguindo a gramática de analisador_sint.py
+    (CMD_IF, CMD_WHILE, CMD_DO_WHILE, CMD_FOR, break, continue, return)
+    e monta um GrafoFluxo por função.
+    """
+
+    def __init__(self, tokens, tabela_simbolos: Dict[str, Dict[str, Any]]):
+        super().__init__(tokens, tabela_simbolos)
+        self.grafos: List[GrafoFluxo] = []
+        self.globais = 0
+        self.grafo: Optional[GrafoFluxo] = None
+        # Bloco onde o comando em leitura continua (None depois de return/break/continue)
+        self.atual: Optional[int] = None
+        # lacos_abertos guarda (destino do continue, destino do break)
+
+    # --- Programa e declarações ---
+
+    def construir(self):
+        self._ler_programa()
+        for grafo in self.grafos:
+            grafo.globais = self.globais
+        return self.grafos, self.erros
+
+    def _declaracao_global(self, declaracoes: List[Declaracao]):
+        for id_simbolo, _, _, _ in declaracoes:
+            self.globais |= 1 << id_simbolo
+
+    def _declaracao_local(self, bloco: int):
+        grafo = self.grafo
+        for id_simbolo, inicializacao, linha, coluna in self._ler_declaracao_local():
+            grafo.locais |= 1 << id_simbolo
+            if inicializacao is not None:
+                grafo.adicionar(bloco, ('atrib', id_simbolo, variaveis_lidas(inicializacao), linha, coluna))
+
+    def _funcao(self, id_nome: int, linha: int, coluna: int):
+        self.grafo = GrafoFluxo(self.nomes.get(id_nome, str(id_nome)), linha, coluna)
+        grafo = self.grafo
+
+        for id_simbolo, linha_p, coluna_p in self._ler_parametros():
+            grafo.parametros |= 1 << id_simbolo
+            grafo.adicionar(grafo.entrada, ('param', id_simbolo, 0, linha_p, coluna_p))
+
+        corpo = grafo.novo_bloco('corpo')
+        grafo.ligar(grafo.entrada, corpo)
+        self.atual = corpo
+        self._percorrer_comando()
+        grafo.ligar(self.atual, grafo.saida)
+
+        # Variáveis lidas ou declaradas que não vêm de parâmetro nem de global começam
+        # com uma definição fictícia 'indef': se ela alcançar um uso, o uso pode ler
+        # um valor nunca atribuído.
+        lidas = 0
+        for bloco in grafo.blocos:
+            for _, _, usos, _, _ in bloco.instrucoes:
+                lidas |= usos
+        indefinidas = (lidas | grafo.locais) & ~(grafo.parametros | self.globais)
+        for id_simbolo in bits(indefinidas):
+            grafo.adicionar(grafo.entrada, ('indef', id_simbolo, 0, linha, coluna))
+
+        self.grafos.append(grafo)
+
+    # --- Comandos ---
+
+    def _comando(self, tarefas):
+        """
+        Lê o início de um COMANDO a partir do bloco `self.atual` e agenda as partes
+        aninhadas. Quando o comando termina, `self.atual` é o bloco onde o fluxo
+        continua, ou None se o comando não deixa o fluxo seguir (return, break, continue).
+        """
+        grafo = self.grafo
+        if self.atual is None:
+            # Código após return/break/continue: bloco sem predecessores (inalcançável)
+            self.atual = grafo.novo_bloco('inalcancavel')
+        bloco = self.atual
+
+        tipo, lexema, linha, coluna = self._atual()
+
+        if tipo == '{':
+            self._abrir_bloco(tarefas)
+            return
+
+        if tipo == 'IF':
+            self._avancar()
+            condicao = self._ler_condicao()
+            constante = valor_logico_constante(condicao)
+            grafo.adicionar(bloco, ('cond', 0, variaveis_lidas(condicao), linha, coluna))
+            entao = grafo.novo_bloco('if.entao')
+            juncao = grafo.novo_bloco('if.fim')
+            if constante is not False:
+                grafo.ligar(bloco, entao)
+            self.atual = entao
+            tarefas.append(('if_apos_entao', (bloco, juncao, constante)))
+            tarefas.append(('comando', None))
+            return
+
+        if tipo == 'WHILE':
+            self._avancar()
+            cabecalho = grafo.novo_bloco('while.cond')
+            grafo.ligar(bloco, cabecalho)
+            condicao = self._ler_condicao()
+            constante = valor_logico_constante(condicao)
+            grafo.adicionar(cabecalho, ('cond', 0, variaveis_lidas(condicao), linha, coluna))
+            corpo = grafo.novo_bloco('while.corpo')
+            depois = grafo.novo_bloco('while.fim')
+            if constante is not False:
+                grafo.ligar(cabecalho, corpo)
+            if constante is not True:
+                grafo.ligar(cabecalho, depois)
+            self._abrir_laco(tarefas, corpo, (cabecalho, depois),
+                             ('laco_fim', (cabecalho, cabecalho, depois, 'while', linha, coluna)))
+            return
+
+        if tipo == 'DO':
+            self._avancar()
+            corpo = grafo.novo_bloco('do.corpo')
+            teste = grafo.novo_bloco('do.cond')
+            depois = grafo.novo_bloco('do.fim')
+            grafo.ligar(bloco, corpo)
+            self._abrir_laco(tarefas, corpo, (teste, depois),
+                             ('do_apos_corpo', (corpo, teste, depois, linha, coluna)))
+            return
+
+        if tipo == 'FOR':
+            inicializacao, condicao, passo_lido = self._ler_cabecalho_for()
+            if inicializacao is not None:
+                self._atribuicao(bloco, inicializacao)
+
+            cabecalho = grafo.novo_bloco('for.cond')
+            grafo.ligar(bloco, cabecalho)
+            if condicao is None:
+                usos, constante = 0, True  # condição vazia: laço sem teste
+            else:
+                usos, constante = variaveis_lidas(condicao), valor_logico_constante(condicao)
+            grafo.adicionar(cabecalho, ('cond', 0, usos, linha, coluna))
+
+            passo = grafo.novo_bloco('for.passo')
+            if passo_lido is not None:
+                self._atribuicao(passo, passo_lido)
+            grafo.ligar(passo, cabecalho)
+
+            corpo = grafo.novo_bloco('for.corpo')
+            depois = grafo.novo_bloco('for.fim')
+            if constante is not False:
+                grafo.ligar(cabecalho, corpo)
+            if constante is not True:
+                grafo.ligar(cabecalho, depois)
+            self._abrir_laco(tarefas, corpo, (passo, depois),
+                             ('laco_fim', (passo, cabecalho, depois, 'for', linha, coluna)))
+            return
+
+        if tipo == 'RETURN':
+            self._avancar()
+            usos = 0
+            if self._tipo_atual() != ';':
+                usos = variaveis_lidas(self._expressao())
+            self._esperar(';')
+            grafo.adicionar(bloco, ('retorno', 0, usos, linha, coluna))
+            grafo.ligar(bloco, grafo.saida)
+            self.atual = None
+            return
+
+        if tipo in ('BREAK', 'CONTINUE'):
+            laco = self._ler_salto_de_laco()
+            if laco is not None:
+                destino_continue, destino_break = laco
+                grafo.ligar(bloco, destino_break if tipo == 'BREAK' else destino_continue)
+                self.atual = None
+            return
+
+        if tipo == 'T_ID':
+            atribuicao = self._ler_atribuicao()
+            if atribuicao is not None:
+                self._atribuicao(bloco, atribuicao)
+            self._esperar(';')
+            return
+
+        if tipo == 'T_TIPO':
+            self._declaracao_local(bloco)
+            return
+
+        self.erros.append((f"Comando inválido iniciado por '{lexema}'", linha, coluna))
+
+    def _abrir_laco(self, tarefas, corpo: int, destinos: Tuple[int, int], continuacao):
+        """Agenda o corpo de um laço com (destino do continue, destino do break) abertos."""
+        self.lacos_abertos.append(destinos)
+        self.atual = corpo
+        tarefas.append(continuacao)
+        tarefas.append(('comando', None))
+
+    def _continuar_comando(self, tarefa: str, dados, tarefas):
+        grafo = self.grafo
+
+        if tarefa == 'if_apos_entao':
+            bloco, juncao, constante = dados
+            grafo.ligar(self.atual, juncao)
+            if self._tipo_atual() == 'ELSE':
+                self._avancar()
+                senao = grafo.novo_bloco('if.senao')
+                if constante is not True:
+                    grafo.ligar(bloco, senao)
+                self.atual = senao
+                tarefas.append(('if_apos_senao', juncao))
+                tarefas.append(('comando', None))
+                return
+            if constante is not True:
+                grafo.ligar(bloco, juncao)
+            self.atual = juncao
+
+        elif tarefa == 'if_apos_senao':
+            grafo.ligar(self.atual, dados)
+            self.atual = dados
+
+        elif tarefa == 'laco_fim':
+            # while e for: o fim do corpo volta ao teste (while) ou ao passo (for)
+            volta, inicio, depois, tipo, linha, coluna = dados
+            grafo.ligar(self.atual, volta)
+            self.lacos_abertos.pop()
+            grafo.lacos.append((inicio, depois, len(grafo.blocos) - 1, tipo, linha, coluna))
+            self.atual = depois
+
+        elif tarefa == 'do_apos_corpo':
+            corpo, teste, depois, linha, coluna = dados
+            grafo.ligar(self.atual, teste)
+            self.lacos_abertos.pop()
+            grafo.lacos.append((corpo, depois, len(grafo.blocos) - 1, 'do-while', linha, coluna))
+            _, _, linha_w, coluna_w = self._atual()
+            self._esperar('WHILE')
+            condicao = self._ler_condicao()
+            self._esperar(';')
+            constante = valor_logico_constante(condicao)
+            grafo.adicionar(teste, ('cond', 0, variaveis_lidas(condicao), linha_w, coluna_w))
+            if constante is not False:
+                grafo.ligar(teste, corpo)
+            if constante is not True:
+                grafo.ligar(teste, depois)
+            self.atual = depois
+
+    def _atribuicao(self, bloco: int, atribuicao):
+        """Registra no bloco uma atribuição lida por `_ler_atribuicao`."""
+        destino, expressao, linha, coluna = atribuicao
+        self.grafo.adicionar(bloco, ('atrib', destino, variaveis_lidas(expressao), linha, coluna))
+
+
+# --- Análises de fluxo de dados (worklist sobre bitsets) ---
+
+def _ordem_reversa_pos(grafo: GrafoFluxo, inicio: int, seguintes: List[List[int]]) -> List[int]:
+    """Pós-ordem reversa a partir de `inicio` seguida dos blocos não visitados."""
+    visitado = [False] * len(grafo.blocos)
+    pos_ordem = []
+    visitado[inicio] = True
+    pilha = [(inicio, 0)]
+    while pilha:
+        bloco, i = pilha[-1]
+        if i < len(seguintes[bloco]):
+            pilha[-1] = (bloco, i + 1)
+            proximo = seguintes[bloco][i]
+            if not visitado[proximo]:
+                visitado[proximo] = True
+                pilha.append((proximo, 0))
+        else:
+            pilha.pop()
+            pos_ordem.append(bloco)
+    pos_ordem.reverse()
+    return pos_ordem + [b for b in range(len(grafo.blocos)) if not visitado[b]]
+
+
+def _resolver_gen_kill(ordem, anteriores, seguintes, gen, kill, fronteira, valor_fronteira):
+    """
+    Resolve um problema de união gen/kill: depois = gen | (antes & ~kill), com
+    antes = OR dos `anteriores` (mais `valor_fronteira` no bloco `fronteira`).
+    A fila de trabalho percorre os blocos em passadas na ordem de `ordem`, e um bloco
+    só volta para a fila quando um vizinho muda. O que chega por uma aresta de
+    retorno fica para a passada seguinte, então as mudanças de todos os laços seguem
+    juntas numa só onda (número de passadas limitado pela profundidade dos laços).
+    """
+    n = len(gen)
+    antes = [0] * n
+    depois = [0] * n
+    posicao = [0] * n
+    for i, bloco in enumerate(ordem):
+        posicao[bloco] = i
+    passada = list(range(n))  # já é uma heap válida (ordenada)
+    na_fila = [True] * n
+    while passada:
+        proxima = []
+        while passada:
+            i = heapq.heappop(passada)
+            bloco = ordem[i]
+            na_fila[bloco] = False
+            valor = valor_fronteira if bloco == fronteira else 0
+            for anterior in anteriores[bloco]:
+                valor |= depois[anterior]
+            antes[bloco] = valor
+            novo = gen[bloco] | (valor & ~kill[bloco])
+            if novo != depois[bloco]:
+                depois[bloco] = novo
+                for seguinte in seguintes[bloco]:
+                    if not na_fila[seguinte]:
+                        na_fila[seguinte] = True
+                        heapq.heappush(passada if posicao[seguinte] > i else proxima, posicao[seguinte])
+        passada = proxima
+    return antes, depois
+
+
+def _sucessores(grafo: GrafoFluxo) -> List[List[int]]:
+    return [bloco.sucessores for bloco in grafo.blocos]
+
+
+def _predecessores(grafo: GrafoFluxo) -> List[List[int]]:
+    return [bloco.predecessores for bloco in grafo.blocos]
+
+
+def listar_definicoes(grafo: GrafoFluxo) -> List[Tuple[int, int, int]]:
+    """Numera as definições do grafo: índice -> (bloco, posição da instrução, variável)."""
+    definicoes = []
+    for bloco in grafo.blocos:
+        for posicao, (_, destino, _, _, _) in enumerate(bloco.instrucoes):
+            if destino:
+                definicoes.append((bloco.indice, posicao, destino))
+    return definicoes
+
+
+def definicoes_alcancantes(grafo: GrafoFluxo):
+    """
+    Definições alcançantes. Devolve (definicoes, entrada, saida), onde entrada/saida
+    são bitsets por bloco indexados pela numeração de `listar_definicoes`. O custo
+    cresce com blocos x definições, por isso as verificações de AnalisadorFluxo não
+    a usam; fica disponível para quem precisa das definições em si.
+    """
+    definicoes = listar_definicoes(grafo)
+    por_variavel: Dict[int, int] = {}
+    for indice, (_, _, variavel) in enumerate(definicoes):
+        por_variavel[variavel] = por_variavel.get(variavel, 0) | (1 << indice)
+
+    n = len(grafo.blocos)
+    gen = [0] * n
+    kill = [0] * n
+    for indice, (bloco, _, variavel) in enumerate(definicoes):
+        # Definições aparecem em ordem dentro do bloco: a última de cada variável vence
+        gen[bloco] = (gen[bloco] & ~por_variavel[variavel]) | (1 << indice)
+        kill[bloco] |= por_variavel[variavel]
+
+    sucessores, predecessores = _sucessores(grafo), _predecessores(grafo)
+    ordem = _ordem_reversa_pos(grafo, grafo.entrada, sucessores)
+    entrada, saida = _resolver_gen_kill(ordem, predecessores, sucessores, gen, kill, grafo.entrada, 0)
+    return definicoes, entrada, saida
+
+
+def variaveis_possivelmente_indefinidas(grafo: GrafoFluxo):
+    """
+    Variáveis possivelmente sem valor (análise para frente). Devolve (entrada, saida):
+    bitsets, indexados pelo ID da variável, das variáveis que em algum caminho desde
+    a entrada ainda não receberam valor. As definições fictícias 'indef' geram a
+    variável e qualquer outra definição a remove.
+    """
+    n = len(grafo.blocos)
+    indefinidas = [0] * n
+    definidas = [0] * n
+    for bloco in grafo.blocos:
+        for tipo, destino, _, _, _ in bloco.instrucoes:
+            if tipo == 'indef':
+                indefinidas[bloco.indice] |= 1 << destino
+            elif destino:
+                indefinidas[bloco.indice] &= ~(1 << destino)
+                definidas[bloco.indice] |= 1 << destino
+
+    sucessores, predecessores = _sucessores(grafo), _predecessores(grafo)
+    ordem = _ordem_reversa_pos(grafo, grafo.entrada, sucessores)
+    return _resolver_gen_kill(ordem, predecessores, sucessores, indefinidas, definidas, grafo.entrada, 0)
+
+
+def variaveis_vivas(grafo: GrafoFluxo):
+    """
+    Vivacidade (análise para trás). Devolve (entrada, saida): bitsets de variáveis
+    vivas no início e no fim de cada bloco. Variáveis globais estão vivas na saída.
+    """
+    n = len(grafo.blocos)
+    uso = [0] * n
+    definido = [0] * n
+    for bloco in grafo.blocos:
+        for tipo, destino, usos, _, _ in bloco.instrucoes:
+            if tipo == 'indef':
+                continue
+            uso[bloco.indice] |= usos & ~definido[bloco.indice]
+            if destino:
+                definido[bloco.indice] |= 1 << destino
+
+    sucessores, predecessores = _sucessores(grafo), _predecessores(grafo)
+    ordem = _ordem_reversa_pos(grafo, grafo.saida, predecessores)
+    saida, entrada = _resolver_gen_kill(ordem, sucessores, predecessores, uso, definido,
+                                        grafo.saida, grafo.globais)
+    return entrada, saida
+
+
+def blocos_alcancaveis(grafo: GrafoFluxo, inicio: int, seguintes: List[List[int]]) -> List[bool]:
+    alcancado = [False] * len(grafo.blocos)
+    alcancado[inicio] = True
+    pilha = [inicio]
+    while pilha:
+        bloco = pilha.pop()
+        for seguinte in seguintes[bloco]:
+            if not alcancado[seguinte]:
+                alcancado[seguinte] = True
+                pilha.append(seguinte)
+    return alcancado
+
+
+class AnalisadorFluxo:
+    def __init__(self, tokens, tabela_simbolos: Dict[str, Dict[str, Any]]):
+        self.tokens = tokens
+        self.tabela_simbolos = tabela_simbolos
+        self.nomes = {dados['id']: lexema for lexema, dados in tabela_simbolos.items()}
+        self.avisos: List[Tuple[str, int, int]] = []
+
+    def analisar(self):
+        """Monta os CFGs e executa as análises. Devolve (grafos, avisos, erros)."""
+        grafos, erros = ConstrutorCFG(self.tokens, self.tabela_simbolos).construir()
+        for grafo in grafos:
+            alcancavel = blocos_alcancaveis(grafo, grafo.entrada, _sucessores(grafo))
+            self._uso_antes_de_atribuicao(grafo, alcancavel)
+            self._atribuicoes_mortas(grafo, alcancavel)
+            self._codigo_inalcancavel(grafo, alcancavel)
+            self._lacos_infinitos(grafo, alcancavel)
+        self.avisos.sort(key=lambda aviso: (aviso[1], aviso[2]))
+        return grafos, self.avisos, erros
+
+    def _nome(self, id_simbolo: int) -> str:
+        return self.nomes.get(id_simbolo, f"#{id_simbolo}")
+
+    def _uso_antes_de_atribuicao(self, grafo: GrafoFluxo, alcancavel: List[bool]):
+        # Um uso pode ler valor não atribuído quando a variável chega possivelmente
+        # indefinida ao bloco e não foi atribuída antes dentro dele.
+        entrada, _ = variaveis_possivelmente_indefinidas(grafo)
+        for bloco in grafo.blocos:
+            if not alcancavel[bloco.indice]:
+                continue
+            indefinidas = entrada[bloco.indice]
+            for tipo, destino, usos, linha, coluna in bloco.instrucoes:
+                if not indefinidas:
+                    break
+                if tipo == 'indef':
+                    continue
+                for id_simbolo in bits(usos & indefinidas):
+                    self.avisos.append((
+                        f"Função '{grafo.nome}': variável '{self._nome(id_simbolo)}' pode ser lida antes de receber valor",
+                        linha, coluna))
+                if destino:
+                    indefinidas &= ~(1 << destino)
+
+    def _atribuicoes_mortas(self, grafo: GrafoFluxo, alcancavel: List[bool]):
+        _, saida = variaveis_vivas(grafo)
+        for bloco in grafo.blocos:
+            if not alcancavel[bloco.indice]:
+                continue
+            vivas = saida[bloco.indice]
+            for tipo, destino, usos, linha, coluna in reversed(bloco.instrucoes):
+                if tipo == 'indef':
+                    continue
+                if tipo == 'atrib' and not (vivas >> destino) & 1:
+                    self.avisos.append((
+                        f"Função '{grafo.nome}': valor atribuído a '{self._nome(destino)}' nunca é utilizado",
+                        linha, coluna))
+                if destino:
+                    vivas &= ~(1 << destino)
+                vivas |= usos
+
+    def _codigo_inalcancavel(self, grafo: GrafoFluxo, alcancavel: List[bool]):
+        # Toda região morta começa em um bloco sem predecessores; reporta-se a primeira
+        # instrução (na ordem do código) de cada região. Cada bloco é visitado uma vez.
+        visitado = list(alcancavel)
+        visitado[grafo.saida] = True
+        for bloco in grafo.blocos:
+            if visitado[bloco.indice] or bloco.predecessores:
+                continue
+            visitado[bloco.indice] = True
+            pilha = [bloco.indice]
+            primeira = None
+            while pilha:
+                atual = grafo.blocos[pilha.pop()]
+                for _, _, _, linha, coluna in atual.instrucoes:
+                    if primeira is None or (linha, coluna) < primeira:
+                        primeira = (linha, coluna)
+                for seguinte in atual.sucessores:
+                    if not visitado[seguinte]:
+                        visitado[seguinte] = True
+                        pilha.append(seguinte)
+            if primeira is not None:
+                self.avisos.append((f"Função '{grafo.nome}': código inalcançável", primeira[0], primeira[1]))
+
+    def _lacos_infinitos(self, grafo: GrafoFluxo, alcancavel: List[bool]):
+        # Um laço é infinito quando, partindo do cabeçalho e andando só dentro dos
+        # blocos do laço, nenhuma aresta sai dele (nem pelo teste, break ou return).
+        # Cada busca visita apenas os blocos do próprio laço.
+        for cabecalho, depois, ultimo, tipo, linha, coluna in grafo.lacos:
+            if not alcancavel[cabecalho]:
+                continue
+            visitado = {cabecalho}
+            pilha = [cabecalho]
+            escapa = False
+            while pilha and not escapa:
+                for seguinte in grafo.blocos[pilha.pop()].sucessores:
+                    if seguinte == depois or not cabecalho <= seguinte <= ultimo:
+                        escapa = True
+                        break
+                    if seguinte not in visitado:
+                        visitado.add(seguinte)
+                        pilha.append(seguinte)
+            if not escapa:
+                self.avisos.append((
+                    f"Função '{grafo.nome}': laço '{tipo}' infinito (nenhum caminho sai do laço)",
+                    linha, coluna))
+
+
+def imprimir_grafo(grafo: GrafoFluxo, nomes: Dict[int, str]):
+    print(f"\n--- CFG DA FUNÇÃO '{grafo.nome}' (Linha {grafo.linha}) ---")
+    for bloco in grafo.blocos:
+        print(f"  B{bloco.indice:<3} [{bloco.rotulo}] -> {', '.join(f'B{s}' for s in bloco.sucessores) or '(nenhum)'}")
+        for tipo, destino, usos, linha, _ in bloco.instrucoes:
+            lidas = [nomes.get(i, f"#{i}") for i in bits(usos)]
+            alvo = nomes.get(destino, '') if destino else ''
+            print(f"      {tipo:8} {alvo:12} usa {{{', '.join(lidas)}}} (Linha {linha})")
+
+
+if __name__ == "__main__":
+    codigo_teste = """
+    int contador(int limite) {
+        int i;
+        int total = 0;
+        total = total + i;
+        while (true) {
+            i = i + 1;
+        }
+        return total;
+    }
+    """
+
+    lexico = AnalisadorLexico(codigo_teste)
+    tokens, tabela_simbolos, _ = lexico.analisar()
+
+    fluxo = AnalisadorFluxo(tokens, tabela_simbolos)
+    grafos, avisos, erros = fluxo.analisar()
+
+    for grafo in grafos:
+        imprimir_grafo(grafo, fluxo.nomes)
+
+    print("\n--- AVISOS DE FLUXO ---")
+    for msg, linha, coluna in avisos:
+        print(f"  AVISO: {msg} (Linha {linha}, Coluna {coluna})")
+    for msg, linha, coluna in erros:
+        print(f"  ERRO: {msg} (Linha {linha}, Coluna {coluna})")
@@ -33,7 +33,12 @@ TOKENS_DE_UM_CARACTERE = {
 
 class AnalisadorLexico:
     def __init__(self, codigo_fonte: str):
+        self.reiniciar(codigo_fonte)
+
+    def reiniciar(self, codigo_fonte: str):
+        """Prepara a instância para analisar um novo código, sem recriar o analisador."""
         self.codigo_fonte = codigo_fonte
+        self.tamanho = len(codigo_fonte)
         self.posicao_atual = 0
         self.linha = 1
         self.coluna = 1
@@ -44,7 +49,7 @@ class AnalisadorLexico:
 
     def ver_proximo(self, k=0) -> Optional[str]:
         indice = self.posicao_atual + k
-        if indice < len(self.codigo_fonte):
+        if indice < self.tamanho:
             return self.codigo_fonte[indice]
         return None
 
@@ -82,8 +87,10 @@ class AnalisadorLexico:
 
     def _analisar_identificador_ou_palavra_reservada(self, linha_inicio, coluna_inicio):
         lexema = ''
-        while self.ver_proximo() is not None and (self.ver_proximo().isalnum() or self.ver_proximo() == '_'):
+        char_atual = self.ver_proximo()
+        while char_atual is not None and (char_atual.isalnum() or char_atual == '_'):
             lexema += self.avancar()
+            char_atual = self.ver_proximo()
 
         tipo_token = PALAVRAS_RESERVADAS.get(lexema, 'T_ID')
         self.adicionar_token(tipo_token, lexema, linha_inicio, coluna_inicio)
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Iterable, List, Tuple, Mapping, Any
+from analisador_lexer import AnalisadorLexico
+from analisador_sint import AnalisadorSintatico
+
+
+class ResultadoLote:
+    """
+    Resultados de um lote em formato colunar: a posição i de cada lista corresponde
+    ao i-ésimo código recebido; `aceitos[i]` só é True sem erros léxicos nem
+    sintáticos. Códigos repetidos compartilham o mesmo resultado do cache, por
+    isso tokens e erros são tuplas e cada tabela de símbolos é uma visão somente
+    leitura (MappingProxyType), inclusive as entradas internas.
+    """
+
+    def __init__(self):
+        self.codigos: List[str] = []
+        self.tokens: List[Tuple[Tuple[str, str, int, int], ...]] = []
+        self.tabelas_simbolos: List[Mapping[str, Mapping[str, Any]]] = []
+        self.erros_lexicos: List[Tuple[Tuple[str, int, int], ...]] = []
+        self.aceitos: List[bool] = []
+        self.erros_sintaticos: List[Tuple[str, ...]] = []
+        self.do_cache: List[bool] = []
+
+    def __len__(self):
+        return len(self.codigos)
+
+
+class AnalisadorLote:
+    """
+    Analisa muitos códigos curtos reaproveitando um único par de analisadores
+    (léxico e sintático), reiniciados a cada código, e memoriza os resultados
+    dos últimos `capacidade_cache` códigos distintos (LRU).
+    """
+
+    def __init__(self, capacidade_cache: int = 1024):
+        self.lexico = AnalisadorLexico('')
+        self.sintatico = AnalisadorSintatico([], verboso=False)
+        self.capacidade_cache = capacidade_cache
+        self.cache: OrderedDict = OrderedDict()
+        self.acertos_cache = 0
+        self.falhas_cache = 0
+
+    def analisar_codigo(self, codigo: str):
+        """
+        Analisa um único código. Devolve (tokens, tabela_simbolos, erros_lexicos,
+        aceito, erros_sintaticos) e se o resultado veio do cache.
+        """
+        resultado = self.cache.get(codigo)
+        if resultado is not None:
+            self.cache.move_to_end(codigo)
+            self.acertos_cache += 1
+            return resultado, True
+
+        self.falhas_cache += 1
+        self.lexico.reiniciar(codigo)
+        tokens, tabela_simbolos, erros_lex = self.lexico.analisar()
+
+        self.sintatico.reiniciar(tokens)
+        resultado_sint = self.sintatico.analisar()
+        erros_sint = tuple(resultado_sint[1]) if not resultado_sint[0] else ()
+        # Aceito só se passou pelas duas etapas: o léxico descarta o que não reconhece
+        aceito = resultado_sint[0] and not erros_lex
+
+        # O resultado fica no cache e é devolvido a cada repetição do código: nada nele pode ser mutável
+        tabela_somente_leitura = MappingProxyType(
+            {lexema: MappingProxyType(dados) for lexema, dados in tabela_simbolos.items()})
+        resultado = (tuple(tokens), tabela_somente_leitura, tuple(erros_lex), aceito, erros_sint)
+        if self.capacidade_cache > 0:
+            self.cache[codigo] = resultado
+            if len(self.cache) > self.capacidade_cache:
+                self.cache.popitem(last=False)
+        return resultado, False
+
+    def analisar(self, codigos: Iterable[str]) -> ResultadoLote:
+        """Analisa todos os códigos do iterável e devolve os resultados em colunas."""
+        lote = ResultadoLote()
+        for codigo in codigos:
+            (tokens, tabela_simbolos, erros_lex, aceito, erros_sint), do_cache = self.analisar_codigo(codigo)
+            lote.codigos.append(codigo)
+            lote.tokens.append(tokens)
+            lote.tabelas_simbolos.append(tabela_simbolos)
+            lote.erros_lexicos.append(erros_lex)
+            lote.aceitos.append(aceito)
+            lote.erros_sintaticos.append(erros_sint)
+            lote.do_cache.append(do_cache)
+        return lote
+
+
+if __name__ == "__main__":
+    amostras = [
+        "int x = 10;",
+        "float media(int a, int b) { return a + b / 2; }",
+        "int resultado @= 10;",
+        "int f() { if (x > ) { x = 1; } return x; }",
+        "int x = 10;",
+    ]
+
+    analisador = AnalisadorLote(capacidade_cache=128)
+    lote = analisador.analisar(amostras)
+
+    for i in range(len(lote)):
+        origem = "cache" if lote.do_cache[i] else "analisado"
+        situacao = "ACEITO" if lote.aceitos[i] else "REJEITADO"
+        print(f"[{i}] {situacao:9} ({origem:9}) tokens={len(lote.tokens[i]):3} `{lote.codigos[i]}`")
+        for msg, linha, coluna in lote.erros_lexicos[i]:
+            print(f"      ERRO LÉXICO: {msg} (Linha {linha}, Coluna {coluna})")
+        for erro in lote.erros_sintaticos[i]:
+            print(f"      {erro}")
+
+    print(f"\nCache: {analisador.acertos_cache} acertos, {analisador.falhas_cache} falhas")
@@ -1,35 +1,36 @@
 import sys
 from analisador_lexer import AnalisadorLexico
 
+# Mapeamento: Token do Léxico -> Terminal da Gramática
+MAPA_TERMINAIS = {
+    'T_TIPO': 'tipo',
+    'T_ID': 'id',
+    'T_NUMERO_INT': 'numero',
+    'T_NUMERO_FLOAT': 'numero',
+    'IF': 'if', 'ELSE': 'else', 'WHILE': 'while', 
+    'DO': 'do', 'FOR': 'for', 'RETURN': 'return', 
+    'BREAK': 'break', 'CONTINUE': 'continue',
+    'T_OP_ARIT': 'op_arit', 'T_OP_REL': 'op_rel', 
+    'T_OP_LOGICO': 'op_logico',
+    '=': '=', ';': ';', ',': ',', 
+    '(': '(', ')': ')', '{': '{', '}': '}',
+    'EOF': 'EOF'
+}
+
+TERMINAIS = set(MAPA_TERMINAIS.values())
+
 class AnalisadorSintatico:
-    def __init__(self, tokens):
+    # Tabela M compartilhada por todas as instâncias (construída uma única vez)
+    _tabela_m_compartilhada = None
+
+    def __init__(self, tokens, verboso: bool = True):
         """
         Inicializa o analisador sintático.
         :param tokens: Lista de tokens gerada pelo analisador léxico.
+        :param verboso: Se False, a análise não imprime mensagens (uso em lote).
         """
-        # Adiciona o marcador de fim de arquivo ($)
-        # O formato do token do seu léxico é (tipo, lexema, linha, coluna)
-        self.tokens = tokens + [('EOF', '$', -1, -1)]
-        self.posicao = 0
-        self.pilha = ['$']  # Pilha inicializada apenas com $
-        self.pilha.append('PROGRAMA') # Empilha o símbolo inicial
-        self.erros =[]
-        
-        # Mapeamento: Token do Léxico -> Terminal da Gramática
-        self.mapa_terminais = {
-            'T_TIPO': 'tipo',
-            'T_ID': 'id',
-            'T_NUMERO_INT': 'numero',
-            'T_NUMERO_FLOAT': 'numero',
-            'IF': 'if', 'ELSE': 'else', 'WHILE': 'while', 
-            'DO': 'do', 'FOR': 'for', 'RETURN': 'return', 
-            'BREAK': 'break', 'CONTINUE': 'continue',
-            'T_OP_ARIT': 'op_arit', 'T_OP_REL': 'op_rel', 
-            'T_OP_LOGICO': 'op_logico',
-            '=': '=', ';': ';', ',': ',', 
-            '(': '(', ')': ')', '{': '{', '}': '}',
-            'EOF': 'EOF'
-        }
+        self.verboso = verboso
+        self.mapa_terminais = MAPA_TERMINAIS
 
         # --- TABELA SINTÁTICA LL(1) COMPLETA COM MODO PÂNICO ---
         # Chave: Não-Terminal
@@ -38,7 +39,21 @@ class AnalisadorSintatico:
         #   ('p',): Produção (Empilha B, depois A)
         #   ('epsilon',): Produção Vazia (Não empilha nada)
         #   ('sync',): Erro recuperável (Desempilha o Não-Terminal atual)
-        self.tabela_m = self._construir_tabela_m()
+        if AnalisadorSintatico._tabela_m_compartilhada is None:
+            AnalisadorSintatico._tabela_m_compartilhada = self._construir_tabela_m()
+        self.tabela_m = AnalisadorSintatico._tabela_m_compartilhada
+
+        self.reiniciar(tokens)
+
+    def reiniciar(self, tokens):
+        """Prepara a instância para analisar uma nova lista de tokens."""
+        # Adiciona o marcador de fim de arquivo ($)
+        # O formato do token do seu léxico é (tipo, lexema, linha, coluna)
+        self.tokens = tokens + [('EOF', '$', -1, -1)]
+        self.posicao = 0
+        self.pilha = ['$']  # Pilha inicializada apenas com $
+        self.pilha.append('PROGRAMA') # Empilha o símbolo inicial
+        self.erros =[]
 
     def _obter_terminal(self, token):
         """Traduz o token do léxico para a linguagem da gramática."""
@@ -55,7 +70,7 @@ class AnalisadorSintatico:
         return None
 
     def analisar(self):
-        print(f"\n{'='*20} INICIANDO ANÁLISE SINTÁTICA {'='*20}")
+        self._imprimir(f"\n{'='*20} INICIANDO ANÁLISE SINTÁTICA {'='*20}")
         
         while len(self.pilha) > 0:
             topo = self.pilha[-1]
@@ -65,13 +80,13 @@ class AnalisadorSintatico:
 
             # Se o token não for mapeado (ex: erro léxico), ignoramos
             if terminal_atual is None:
-                print(f"Ignorando token desconhecido na análise sintática: {lexema_atual}")
+                self._imprimir(f"Ignorando token desconhecido na análise sintática: {lexema_atual}")
                 self.posicao += 1
                 continue
 
             # --- CASO 1: Sucesso ---
             if topo == '$' and terminal_atual == 'EOF':
-                print(f"\n Pilha vazia e fim de arquivo alcançado.")
+                self._imprimir(f"\n Pilha vazia e fim de arquivo alcançado.")
                 break
 
             # --- CASO 2: Topo é Terminal ---
@@ -83,7 +98,7 @@ class AnalisadorSintatico:
                 continue
             
             # Se topo é terminal mas não casou (e não é $), é um erro grave de correspondência
-            if topo in self.mapa_terminais.values() or topo == '$':
+            if topo in TERMINAIS or topo == '$':
                 self._registrar_erro(f"Esperado '{topo}', mas encontrado '{lexema_atual}'", linha, coluna)
                 self.pilha.pop() # Tenta recuperar desempilhando o terminal esperado que faltou
                 continue
@@ -128,16 +143,34 @@ class AnalisadorSintatico:
                       self._registrar_erro(f"Ação desconhecida na tabela M para '{topo}' e '{terminal_atual}': {acao}", linha, coluna)
                       self.posicao += 1
 
-                  if self.erros:
-                      print(f"\nAnálise finalizada com {len(self.erros)} erros.")
-                      return False, self.erros
-                  else:
-                      print("\nAnálise finalizada sem erros!")
-                      return True,
+              elif terminal_atual == 'EOF':
+                  # Não há mais tokens para descartar: desiste do não-terminal
+                  self._registrar_erro(f"Fim de arquivo inesperado ao analisar '{topo}'", linha, coluna)
+                  self.pilha.pop()
+
+              else:
+                  # Modo pânico: descarta o token até achar um que a regra aceite
+                  self._registrar_erro(f"Token inesperado '{lexema_atual}' ao analisar '{topo}'. Descartando token.", linha, coluna)
+                  self.posicao += 1
+              continue
+
+            # Símbolo desconhecido na pilha
+            self.pilha.pop()
+
+        if self.erros:
+            self._imprimir(f"\nAnálise finalizada com {len(self.erros)} erros.")
+            return False, self.erros
+        else:
+            self._imprimir("\nAnálise finalizada sem erros!")
+            return True,
+
+    def _imprimir(self, mensagem):
+        if self.verboso:
+            print(mensagem)
 
     def _registrar_erro(self, msg, linha, coluna):
         erro_fmt = f"ERRO SINTÁTICO (L{linha}, C{coluna}): {msg}"
-        print(erro_fmt)
+        self._imprimir(erro_fmt)
         self.erros.append(erro_fmt)
 
     def _construir_tabela_m(self):
@@ -218,11 +251,12 @@ class AnalisadorSintatico:
                 'continue': ('p', ['COMANDO', 'LISTA_COMANDOS']),
                 'id': ('p', ['COMANDO', 'LISTA_COMANDOS']),
                 '{': ('p', ['COMANDO', 'LISTA_COMANDOS']),
+                'tipo': ('p', ['COMANDO', 'LISTA_COMANDOS']),
                 '}': ('epsilon',)
             },
 
             # COMANDO -> CMD_IF | CMD_WHILE | CMD_DO_WHILE | CMD_FOR | CMD_RETURN |
-            #            CMD_BREAK | CMD_CONTINUE | CMD_ATRIBUICAO | BLOCO
+            #            CMD_BREAK | CMD_CONTINUE | CMD_ATRIBUICAO | BLOCO | DECL_LOCAL
             'COMANDO': {
                 'if': ('p', ['CMD_IF']),
                 'while': ('p', ['CMD_WHILE']),
@@ -232,7 +266,13 @@ class AnalisadorSintatico:
                 'break': ('p', ['CMD_BREAK']),
                 'continue': ('p', ['CMD_CONTINUE']),
                 'id': ('p', ['ATRIBUICAO_SIMPLES', ';']),
-                '{': ('p', ['BLOCO'])
+                '{': ('p', ['BLOCO']),
+                'tipo': ('p', ['DECL_LOCAL'])
+            },
+
+            # DECL_LOCAL -> tipo id INICIALIZACAO_OPCIONAL LISTA_IDS_RESTO ;
+            'DECL_LOCAL': {
+                'tipo': ('p', ['tipo', 'id', 'INICIALIZACAO_OPCIONAL', 'LISTA_IDS_RESTO', ';'])
             },
 
             # CMD_IF -> if ( EXPRESSAO ) COMANDO CMD_IF_RESTO
@@ -247,7 +287,7 @@ class AnalisadorSintatico:
                 'if': ('epsilon',), 'while': ('epsilon',), 'do': ('epsilon',),
                 'for': ('epsilon',), 'return': ('epsilon',), 'break': ('epsilon',),
                 'continue': ('epsilon',), 'id': ('epsilon',), '{': ('epsilon',),
-                '}': ('epsilon',), 'EOF': ('epsilon',)
+                'tipo': ('epsilon',), '}': ('epsilon',), 'EOF': ('epsilon',)
             },
 
             # CMD_WHILE -> while ( EXPRESSAO ) COMANDO
@@ -0,0 +1,507 @@
+from array import array
+from typing import List, Tuple, Dict, Any, Union
+from analisador_lexer import AnalisadorLexico
+from leitor_programa import LeitorPrograma, Declaracao, Expressao
+
+# --- Opcodes do código de três endereços (TAC) ---
+# Cada instrução ocupa a mesma posição em quatro arrays planos: opcode, dst, src1, src2.
+(OP_COPIA,                                                  # dst = src1
+ OP_SOMA, OP_SUB, OP_MUL, OP_DIV, OP_MOD, OP_POT,           # dst = src1 op src2
+ OP_MENOR, OP_MENOR_IGUAL, OP_MAIOR, OP_MAIOR_IGUAL,
+ OP_IGUAL, OP_DIFERENTE,                                    # dst = (src1 op src2) ? 1 : 0
+ OP_NEG, OP_NAO,                                            # dst = -src1 | dst = !src1
+ OP_ROTULO,                                                 # dst: número do rótulo
+ OP_SALTO,                                                  # goto dst
+ OP_SALTO_SE,                                               # if src1 goto dst
+ OP_FUNCAO,                                                 # dst: slot do nome, src1: nº de parâmetros
+ OP_PARAM,                                                  # dst: slot do parâmetro
+ OP_RETORNA,                                                # return src1 (0 = sem valor)
+ ) = range(21)
+
+OPERADORES_BINARIOS = {
+    '+': OP_SOMA, '-': OP_SUB, '*': OP_MUL, '/': OP_DIV, '%': OP_MOD, '^': OP_POT,
+    '<': OP_MENOR, '<=': OP_MENOR_IGUAL, '>': OP_MAIOR, '>=': OP_MAIOR_IGUAL,
+    '==': OP_IGUAL, '!=': OP_DIFERENTE
+}
+
+SIMBOLOS_OPCODES = {opcode: simbolo for simbolo, opcode in OPERADORES_BINARIOS.items()}
+
+
+def _juntar(listas: List[List[int]]) -> List[int]:
+    """
+    Junta listas de remendo estendendo a maior delas (cada lista tem um único dono),
+    para que cadeias aninhadas não copiem a mesma lista a cada nível.
+    """
+    maior = max(listas, key=len)
+    for lista in listas:
+        if lista is not maior:
+            maior.extend(lista)
+    return maior
+
+
+class CodigoIntermediario:
+    """
+    Código de três endereços em arrays planos.
+
+    Operandos são slots inteiros:
+      0           -> nenhum operando
+      1..N        -> variáveis (o slot é o ID da tabela de símbolos)
+      >= primeiro_temporario -> temporários
+      negativos   -> constante `constantes[-slot - 1]`
+    Rótulos são numerados a partir de 1; `rotulos[r]` é o índice da instrução ROTULO r.
+    """
+
+    def __init__(self, nomes: Dict[int, str], primeiro_temporario: int):
+        self.opcode = array('i')
+        self.dst = array('i')
+        self.src1 = array('i')
+        self.src2 = array('i')
+        self.constantes: List[Union[int, float]] = []
+        self.rotulos = array('i', [0])
+        self.nomes = nomes
+        self.primeiro_temporario = primeiro_temporario
+        self.total_slots = primeiro_temporario
+        # Nome da função -> índice da instrução FUNCAO
+        self.funcoes: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.opcode)
+
+    def emitir(self, opcode: int, dst: int = 0, src1: int = 0, src2: int = 0) -> int:
+        self.opcode.append(opcode)
+        self.dst.append(dst)
+        self.src1.append(src1)
+        self.src2.append(src2)
+        return len(self.opcode) - 1
+
+    def _operando(self, slot: int) -> str:
+        if slot < 0:
+            return str(self.constantes[-slot - 1])
+        if slot >= self.primeiro_temporario:
+            return f"t{slot - self.primeiro_temporario}"
+        return self.nomes.get(slot, f"#{slot}")
+
+    def texto(self) -> str:
+        """Listagem legível do código, uma instrução por linha (para depuração)."""
+        linhas = []
+        for i in range(len(self.opcode)):
+            op, dst, a, b = self.opcode[i], self.dst[i], self.src1[i], self.src2[i]
+            if op == OP_ROTULO:
+                linhas.append(f"{i:5}: L{dst}:")
+                continue
+            if op == OP_COPIA:
+                texto = f"{self._operando(dst)} = {self._operando(a)}"
+            elif op in SIMBOLOS_OPCODES:
+                texto = f"{self._operando(dst)} = {self._operando(a)} {SIMBOLOS_OPCODES[op]} {self._operando(b)}"
+            elif op == OP_NEG:
+                texto = f"{self._operando(dst)} = -{self._operando(a)}"
+            elif op == OP_NAO:
+                texto = f"{self._operando(dst)} = !{self._operando(a)}"
+            elif op == OP_SALTO:
+                texto = f"goto L{dst}"
+            elif op == OP_SALTO_SE:
+                texto = f"if {self._operando(a)} goto L{dst}"
+            elif op == OP_FUNCAO:
+                texto = f"funcao {self._operando(dst)}/{a}"
+            elif op == OP_PARAM:
+                texto = f"param {self._operando(dst)}"
+            else:
+                texto = f"return {self._operando(a)}" if a else "return"
+            linhas.append(f"{i:5}:     {texto}")
+        return "\n".join(linhas)
+
+
+class GeradorCodigo(LeitorPrograma):
+    """
+    Traduz os tokens de um programa aceito para código de três endereços, em uma
+    única passada dirigida pela sintaxe (mesma gramática de analisador_sint.py).
+    Saltos de condições usam listas de remendo (backpatching), o que dá a
+    avaliação em curto-circuito de && e || sem reprocessar código já emitido.
+    """
+
+    def __init__(self, tokens, tabela_simbolos: Dict[str, Dict[str, Any]]):
+        super().__init__(tokens, tabela_simbolos)
+        self.codigo = CodigoIntermediario(self.nomes, max(self.nomes, default=0) + 1)
+        self.indices_constantes: Dict[Tuple[type, Union[int, float]], int] = {}
+        self.proximo_temporario = self.codigo.primeiro_temporario
+        # lacos_abertos guarda (saltos de continue, saltos de break) a remendar
+
+    # --- Slots, rótulos e remendos ---
+
+    def _constante(self, valor: Union[int, float]) -> int:
+        # A chave inclui o tipo: 0 e 0.0 são iguais para dict, mas são constantes diferentes
+        chave = (type(valor), valor)
+        indice = self.indices_constantes.get(chave)
+        if indice is None:
+            indice = len(self.codigo.constantes)
+            self.codigo.constantes.append(valor)
+            self.indices_constantes[chave] = indice
+        return -indice - 1
+
+    def _liberar_temporarios(self):
+        """Temporários não sobrevivem entre comandos: cada comando reaproveita os slots."""
+        self.proximo_temporario = self.codigo.primeiro_temporario
+
+    def _novo_temporario(self) -> int:
+        slot = self.proximo_temporario
+        self.proximo_temporario += 1
+        if self.proximo_temporario > self.codigo.total_slots:
+            self.codigo.total_slots = self.proximo_temporario
+        return slot
+
+    def _colocar_rotulo(self) -> int:
+        """Emite um novo rótulo na posição atual e devolve seu número."""
+        rotulo = len(self.codigo.rotulos)
+        self.codigo.rotulos.append(self.codigo.emitir(OP_ROTULO, rotulo))
+        return rotulo
+
+    def _remendar(self, saltos: List[int], rotulo: int):
+        for indice in saltos:
+            self.codigo.dst[indice] = rotulo
+
+    # --- Programa e declarações ---
+
+    def gerar(self):
+        self._ler_programa()
+        return self.codigo, self.erros
+
+    def _declaracao_global(self, declaracoes: List[Declaracao]):
+        # Inicializações globais ficam fora de qualquer função, na ordem do código
+        self._inicializar(declaracoes)
+
+    def _inicializar(self, declaracoes: List[Declaracao]):
+        """Só as declarações com inicialização geram código."""
+        for slot, inicializacao, _, _ in declaracoes:
+            if inicializacao is not None:
+                self._liberar_temporarios()
+                self._atribuir(slot, inicializacao)
+
+    def _funcao(self, slot_nome: int, linha: int, coluna: int):
+        codigo = self.codigo
+        inicio = codigo.emitir(OP_FUNCAO, slot_nome)
+        codigo.funcoes[codigo.nomes.get(slot_nome, str(slot_nome))] = inicio
+
+        parametros = self._ler_parametros()
+        for slot, _, _ in parametros:
+            codigo.emitir(OP_PARAM, slot)
+        codigo.src1[inicio] = len(parametros)
+
+        self._percorrer_comando()
+        # Retorno implícito para o fluxo que chega ao fim da função
+        codigo.emitir(OP_RETORNA)
+
+    # --- Comandos ---
+
+    def _comando(self, tarefas):
+        """Traduz o início de um COMANDO e agenda as partes aninhadas."""
+        codigo = self.codigo
+        self._liberar_temporarios()
+        tipo, lexema, linha, coluna = self._atual()
+
+        if tipo == '{':
+            self._abrir_bloco(tarefas)
+            return
+
+        if tipo == 'IF':
+            self._avancar()
+            verdadeiro, falso = self._saltos(self._ler_condicao())
+            self._remendar(verdadeiro, self._colocar_rotulo())
+            tarefas.append(('if_apos_entao', falso))
+            tarefas.append(('comando', None))
+            return
+
+        if tipo == 'WHILE':
+            self._avancar()
+            inicio = self._colocar_rotulo()
+            verdadeiro, falso = self._saltos(self._ler_condicao())
+            self._remendar(verdadeiro, self._colocar_rotulo())
+            self._abrir_laco(tarefas, ('while_fim', (inicio, falso)))
+            return
+
+        if tipo == 'DO':
+            self._avancar()
+            self._abrir_laco(tarefas, ('do_fim', self._colocar_rotulo()))
+            return
+
+        if tipo == 'FOR':
+            # O passo aparece antes do corpo no código-fonte, mas é emitido depois dele
+            inicializacao, condicao, passo = self._ler_cabecalho_for()
+            if inicializacao is not None:
+                self._atribuicao(inicializacao)
+
+            teste = self._colocar_rotulo()
+            self._liberar_temporarios()
+            verdadeiro, falso = [], []  # condição vazia: o corpo segue direto
+            if condicao is not None:
+                verdadeiro, falso = self._saltos(condicao)
+
+            self._remendar(verdadeiro, self._colocar_rotulo())
+            self._abrir_laco(tarefas, ('for_fim', (teste, passo, falso)))
+            return
+
+        if tipo == 'RETURN':
+            self._avancar()
+            valor = 0
+            if self._tipo_atual() != ';':
+                valor = self._valor(self._expressao())
+            self._esperar(';')
+            codigo.emitir(OP_RETORNA, 0, valor)
+            return
+
+        if tipo in ('BREAK', 'CONTINUE'):
+            laco = self._ler_salto_de_laco()
+            if laco is not None:
+                continues, breaks = laco
+                (breaks if tipo == 'BREAK' else continues).append(codigo.emitir(OP_SALTO))
+            return
+
+        if tipo == 'T_ID':
+            atribuicao = self._ler_atribuicao()
+            if atribuicao is not None:
+                self._atribuicao(atribuicao)
+            self._esperar(';')
+            return
+
+        if tipo == 'T_TIPO':
+            self._inicializar(self._ler_declaracao_local())
+            return
+
+        self.erros.append((f"Comando inválido iniciado por '{lexema}'", linha, coluna))
+
+    def _abrir_laco(self, tarefas, continuacao):
+        """Agenda o corpo de um laço; continues e breaks dele ficam pendentes até o fim."""
+        self.lacos_abertos.append(([], []))
+        tarefas.append(continuacao)
+        tarefas.append(('comando', None))
+
+    def _continuar_comando(self, tarefa: str, dados, tarefas):
+        codigo = self.codigo
+
+        if tarefa == 'if_apos_entao':
+            falso = dados
+            if self._tipo_atual() == 'ELSE':
+                self._avancar()
+                salto_fim = codigo.emitir(OP_SALTO)
+                self._remendar(falso, self._colocar_rotulo())
+                tarefas.append(('if_fim', [salto_fim]))
+                tarefas.append(('comando', None))
+                return
+            self._remendar(falso, self._colocar_rotulo())
+
+        elif tarefa == 'if_fim':
+            self._remendar(dados, self._colocar_rotulo())
+
+        elif tarefa == 'while_fim':
+            inicio, falso = dados
+            continues, breaks = self.lacos_abertos.pop()
+            codigo.emitir(OP_SALTO, inicio)
+            self._remendar(continues, inicio)
+            self._remendar(falso + breaks, self._colocar_rotulo())
+
+        elif tarefa == 'do_fim':
+            corpo = dados
+            continues, breaks = self.lacos_abertos.pop()
+            self._remendar(continues, self._colocar_rotulo())
+            self._esperar('WHILE')
+            condicao = self._ler_condicao()
+            self._esperar(';')
+            self._liberar_temporarios()
+            verdadeiro, falso = self._saltos(condicao)
+            self._remendar(verdadeiro, corpo)
+            self._remendar(falso + breaks, self._colocar_rotulo())
+
+        elif tarefa == 'for_fim':
+            teste, passo, falso = dados
+            continues, breaks = self.lacos_abertos.pop()
+            self._remendar(continues, self._colocar_rotulo())
+            if passo is not None:
+                self._liberar_temporarios()
+                self._atribuicao(passo)
+            codigo.emitir(OP_SALTO, teste)
+            self._remendar(falso + breaks, self._colocar_rotulo())
+
+    def _atribuicao(self, atribuicao):
+        """Traduz uma atribuição lida por `_ler_atribuicao`."""
+        destino, expressao, _, _ = atribuicao
+        self._atribuir(destino, expressao)
+
+    def _atribuir(self, destino: int, expressao: Expressao):
+        codigo = self.codigo
+        valor = self._valor(expressao)
+        # Se o valor acabou de ser calculado em um temporário, grava direto no destino
+        ultima = len(codigo) - 1
+        if (valor >= codigo.primeiro_temporario and ultima >= 0
+                and codigo.dst[ultima] == valor and codigo.opcode[ultima] != OP_ROTULO):
+            codigo.dst[ultima] = destino
+        else:
+            codigo.emitir(OP_COPIA, destino, valor)
+
+    # --- Expressões ---
+
+    def _valor(self, expressao: Expressao) -> int:
+        """Emite o cálculo da expressão e devolve o slot que contém o resultado."""
+        return self._traduzir(expressao, False)
+
+    def _saltos(self, expressao: Expressao):
+        """
+        Traduz a expressão como condição. Devolve (verdadeiro, falso): índices dos
+        saltos ainda sem destino, a remendar com o rótulo de cada saída.
+        """
+        return self._traduzir(expressao, True)
+
+    def _traduzir(self, expressao: Expressao, como_condicao: bool):
+        """
+        Percorre a árvore com uma pilha de tarefas explícita, para que a profundidade
+        da expressão (parênteses aninhados, cadeias à direita) não dependa da pilha
+        do Python. As tarefas 'valor' e 'saltos' deixam em `resultados` um slot ou
+        um par (verdadeiro, falso); as demais combinam o topo de `resultados`, na
+        mesma ordem de emissão de uma descida recursiva.
+        """
+        codigo = self.codigo
+        resultados = []
+        tarefas = [('saltos' if como_condicao else 'valor', expressao)]
+        while tarefas:
+            tarefa, argumento = tarefas.pop()
+
+            if tarefa == 'valor':
+                if isinstance(argumento, int):
+                    resultados.append(argumento)
+                    continue
+                operador = argumento[0]
+                if operador == 'const':
+                    resultados.append(self._constante(argumento[1]))
+                elif operador in ('&&', '||'):
+                    # Valor 0/1 de uma expressão lógica: reaproveita a tradução em saltos
+                    tarefas.append(('materializar', None))
+                    tarefas.append(('saltos', argumento))
+                elif operador == 'unario':
+                    tarefas.append(('unarios', argumento[1]))
+                    tarefas.append(('valor', argumento[2]))
+                elif operador == '^':
+                    tarefas.append(('potencia', len(argumento[1])))
+                    tarefas.extend(('valor', operando) for operando in reversed(argumento[1]))
+                else:
+                    tarefas.append(('binario', operador))
+                    tarefas.append(('valor', argumento[2]))
+                    tarefas.append(('valor', argumento[1]))
+
+            elif tarefa == 'saltos':
+                operador = argumento[0] if isinstance(argumento, tuple) else None
+                if operador in ('||', '&&'):
+                    # ||: cada operando falso cai no próximo; &&: cada verdadeiro cai no próximo
+                    meio = 'meio_ou' if operador == '||' else 'meio_e'
+                    tarefas.append(('fim_ou' if operador == '||' else 'fim_e', len(argumento[1])))
+                    for operando in reversed(argumento[1][1:]):
+                        tarefas.append(('saltos', operando))
+                        tarefas.append((meio, None))
+                    tarefas.append(('saltos', argumento[1][0]))
+                elif operador == 'unario':
+                    # '-' não muda se o valor é zero; cada '!' troca as saídas
+                    tarefas.append(('trocar', argumento[1].count('!') % 2))
+                    tarefas.append(('saltos', argumento[2]))
+                elif operador == 'const':
+                    # Constante: o salto é incondicional e a outra saída nem existe
+                    salto = codigo.emitir(OP_SALTO)
+                    resultados.append(([salto], []) if argumento[1] else ([], [salto]))
+                else:
+                    tarefas.append(('salto_se', None))
+                    tarefas.append(('valor', argumento))
+
+            elif tarefa == 'binario':
+                direita = resultados.pop()
+                temporario = self._novo_temporario()
+                codigo.emitir(OPERADORES_BINARIOS[argumento], temporario, resultados.pop(), direita)
+                resultados.append(temporario)
+
+            elif tarefa == 'unarios':
+                # Aplica do operador mais interno para o mais externo
+                resultado = resultados.pop()
+                for unario in reversed(argumento):
+                    temporario = self._novo_temporario()
+                    codigo.emitir(OP_NAO if unario == '!' else OP_NEG, temporario, resultado)
+                    resultado = temporario
+                resultados.append(resultado)
+
+            elif tarefa == 'potencia':
+                # a ^ b ^ c = a ^ (b ^ c): dobra os operandos da direita para a esquerda
+                slots = resultados[-argumento:]
+                del resultados[-argumento:]
+                resultado = slots[-1]
+                for slot in reversed(slots[:-1]):
+                    temporario = self._novo_temporario()
+                    codigo.emitir(OP_POT, temporario, slot, resultado)
+                    resultado = temporario
+                resultados.append(resultado)
+
+            elif tarefa == 'meio_ou':
+                verdadeiro, falso = resultados.pop()
+                self._remendar(falso, self._colocar_rotulo())
+                resultados.append(verdadeiro)
+
+            elif tarefa == 'meio_e':
+                verdadeiro, falso = resultados.pop()
+                self._remendar(verdadeiro, self._colocar_rotulo())
+                resultados.append(falso)
+
+            elif tarefa in ('fim_ou', 'fim_e'):
+                verdadeiro, falso = resultados.pop()
+                pendentes = resultados[-argumento + 1:]
+                del resultados[-argumento + 1:]
+                if tarefa == 'fim_ou':
+                    resultados.append((_juntar(pendentes + [verdadeiro]), falso))
+                else:
+                    resultados.append((verdadeiro, _juntar(pendentes + [falso])))
+
+            elif tarefa == 'trocar':
+                if argumento:
+                    verdadeiro, falso = resultados.pop()
+                    resultados.append((falso, verdadeiro))
+
+            elif tarefa == 'salto_se':
+                slot = resultados.pop()
+                resultados.append(([codigo.emitir(OP_SALTO_SE, 0, slot)], [codigo.emitir(OP_SALTO)]))
+
+            else:  # 'materializar'
+                verdadeiro, falso = resultados.pop()
+                resultado = self._novo_temporario()
+                self._remendar(verdadeiro, self._colocar_rotulo())
+                codigo.emitir(OP_COPIA, resultado, self._constante(1))
+                salto_fim = codigo.emitir(OP_SALTO)
+                self._remendar(falso, self._colocar_rotulo())
+                codigo.emitir(OP_COPIA, resultado, self._constante(0))
+                self._remendar([salto_fim], self._colocar_rotulo())
+                resultados.append(resultado)
+
+        return resultados.pop()
+
+
+if __name__ == "__main__":
+    codigo_teste = """
+    float calcular_soma(int limite) {
+        float soma = 0.0;
+        int i;
+        for (i = 1; i <= limite; i = i + 1) {
+            if (soma > 1000.5 || i == 7 && !(limite < 3)) {
+                break;
+            } else {
+                soma = soma + i * 2 - 1;
+            }
+        }
+        do {
+            i = i - 1;
+        } while (i > 0 && soma != 0.0);
+        return soma;
+    }
+    """
+
+    lexico = AnalisadorLexico(codigo_teste)
+    tokens, tabela_simbolos, _ = lexico.analisar()
+
+    gerador = GeradorCodigo(tokens, tabela_simbolos)
+    codigo, erros = gerador.gerar()
+
+    print("--- CÓDIGO DE TRÊS ENDEREÇOS ---")
+    print(codigo.texto())
+    print(f"\n{len(codigo)} instruções, {codigo.total_slots} slots, {len(codigo.rotulos) - 1} rótulos")
+    for msg, linha, coluna in erros:
+        print(f"  ERRO: {msg} (Linha {linha}, Coluna {coluna})")
@@ -0,0 +1,365 @@
+from typing import List, Tuple, Optional, Dict, Any, Union
+
+# Identificadores que a linguagem não reserva, mas que são lidos como constantes
+# booleanas (ex: o `while(true)` de codigo.txt).
+CONSTANTES_BOOLEANAS = {'true': True, 'false': False}
+
+# Árvore de expressão produzida por LeitorPrograma:
+#   variável: int (ID da tabela de símbolos)
+#   constante: ('const', valor)
+#   binária: (operador, esquerda, direita), cadeias à esquerda (a + b + c) aninham pela esquerda
+#   n-ária: ('||' | '&&' | '^', [operandos])
+#   unária: ('unario', [operadores '!' | 'neg', do mais externo ao mais interno], operando)
+# Cadeias de ||, &&, ^ e operadores unários ficam em listas. Parênteses aninhados
+# ainda dão árvores tão profundas quanto o código, por isso a leitura e quem
+# percorre a árvore usam pilhas explícitas em vez de recursão.
+Expressao = Union[int, Tuple]
+
+# Operadores binários: (nível de precedência, operador), do menos ao mais prioritário
+NIVEIS_BINARIOS = {
+    '||': (1, '||'), '&&': (2, '&&'),
+    '+': (4, '+'), '-': (4, '-'),
+    '*': (5, '*'), '/': (5, '/'), '%': (5, '%'),
+    '^': (6, '^'),
+}
+NIVEL_RELACIONAL = 3
+NIVEIS_ESQUERDA = {4, 5}
+OPERADORES_NARIOS = {'||', '&&', '^'}
+
+# Variável declarada: (ID, expressão de inicialização ou None, linha, coluna)
+Declaracao = Tuple[int, Optional[Expressao], int, int]
+
+
+def variaveis_lidas(expressao: Expressao) -> int:
+    """Bitset dos IDs das variáveis lidas pela expressão."""
+    usos = 0
+    pilha = [expressao]
+    while pilha:
+        no = pilha.pop()
+        if isinstance(no, int):
+            usos |= 1 << no
+        elif no[0] == 'const':
+            continue
+        elif no[0] == 'unario':
+            pilha.append(no[2])
+        elif len(no) == 2:
+            pilha.extend(no[1])
+        else:
+            pilha.append(no[1])
+            pilha.append(no[2])
+    return usos
+
+
+def valor_logico_constante(expressao: Expressao) -> Optional[bool]:
+    """Valor lógico da expressão quando ela é uma constante (com '!' e '-'), ou None."""
+    negacoes = 0
+    while isinstance(expressao, tuple) and expressao[0] == 'unario':
+        negacoes += expressao[1].count('!')
+        expressao = expressao[2]
+    if isinstance(expressao, tuple) and expressao[0] == 'const':
+        return (expressao[1] != 0) != (negacoes % 2 == 1)
+    return None
+
+
+class LeitorPrograma:
+    """
+    Leitura dos tokens seguindo a gramática de analisador_sint.py, compartilhada
+    pelas etapas que percorrem o programa (analisador_fluxo e gerador_codigo).
+
+    A base sabe ler declarações, parâmetros, blocos, cabeçalhos de laço e
+    expressões. `_ler_programa` chama dois métodos que cada subclasse define:
+      _funcao(id_nome, linha, coluna): o token atual é o '(' dos parâmetros;
+          deve ler a função inteira (`_ler_parametros` e o corpo).
+      _declaracao_global(declaracoes): recebe a lista de Declaracao já lida.
+    Comandos aninhados são percorridos por `_percorrer_comando` com uma pilha de
+    tarefas explícita; quem o usa define:
+      _comando(tarefas): lê o início de um COMANDO; para cada parte aninhada
+          empilha ('comando', None) e, antes dela, a tarefa que continua o
+          comando depois da parte aninhada.
+      _continuar_comando(tarefa, dados, tarefas): executa essas tarefas.
+    """
+
+    def __init__(self, tokens, tabela_simbolos: Dict[str, Dict[str, Any]]):
+        self.tokens = tokens + [('EOF', '$', -1, -1)]
+        self.posicao = 0
+        self.nomes = {dados['id']: lexema for lexema, dados in tabela_simbolos.items()}
+        self.erros: List[Tuple[str, int, int]] = []
+        # Pilha de laços abertos; o conteúdo de cada entrada é definido pela subclasse
+        self.lacos_abertos: List[Any] = []
+
+    # --- Utilitários de leitura ---
+
+    def _atual(self):
+        return self.tokens[self.posicao]
+
+    def _tipo_atual(self) -> str:
+        return self.tokens[self.posicao][0]
+
+    def _lexema_atual(self) -> str:
+        return self.tokens[self.posicao][1]
+
+    def _avancar(self):
+        token = self.tokens[self.posicao]
+        if token[0] != 'EOF':
+            self.posicao += 1
+        return token
+
+    def _esperar(self, tipo: str) -> bool:
+        """Consome o token se for do tipo esperado; caso contrário registra erro sem consumir."""
+        if self._tipo_atual() == tipo:
+            self._avancar()
+            return True
+        _, lexema, linha, coluna = self._atual()
+        self.erros.append((f"Esperado '{tipo}', mas encontrado '{lexema}'", linha, coluna))
+        return False
+
+    # --- Programa e declarações ---
+
+    def _ler_programa(self):
+        """LISTA_DECL_EXTERNAS: chama `_funcao` ou `_declaracao_global` para cada item."""
+        while self._tipo_atual() != 'EOF':
+            tipo, lexema, linha, coluna = self._atual()
+            if tipo != 'T_TIPO':
+                self.erros.append((f"Token inesperado '{lexema}' fora de função", linha, coluna))
+                self._avancar()
+                continue
+            self._avancar()
+
+            if self._tipo_atual() != 'T_ID':
+                self._esperar('T_ID')
+                continue
+            _, lexema_id, linha_id, coluna_id = self._avancar()
+
+            if self._tipo_atual() == '(':
+                self.lacos_abertos = []
+                self._funcao(int(lexema_id), linha_id, coluna_id)
+            else:
+                self._declaracao_global(self._ler_declaracoes(int(lexema_id), linha_id, coluna_id))
+
+    def _ler_declaracoes(self, id_simbolo: int, linha: int, coluna: int) -> List[Declaracao]:
+        """INICIALIZACAO_OPCIONAL LISTA_IDS_RESTO ; a partir do primeiro id, já consumido."""
+        declaracoes = []
+        while True:
+            inicializacao = None
+            if self._tipo_atual() == '=':
+                self._avancar()
+                inicializacao = self._expressao()
+            declaracoes.append((id_simbolo, inicializacao, linha, coluna))
+            if self._tipo_atual() != ',':
+                break
+            self._avancar()
+            if self._tipo_atual() != 'T_ID':
+                self._esperar('T_ID')
+                break
+            _, lexema, linha, coluna = self._avancar()
+            id_simbolo = int(lexema)
+        self._esperar(';')
+        return declaracoes
+
+    def _ler_declaracao_local(self) -> List[Declaracao]:
+        """tipo id INICIALIZACAO_OPCIONAL LISTA_IDS_RESTO ; dentro de uma função."""
+        self._avancar()  # tipo
+        if self._tipo_atual() != 'T_ID':
+            self._esperar('T_ID')
+            return []
+        _, lexema, linha, coluna = self._avancar()
+        return self._ler_declaracoes(int(lexema), linha, coluna)
+
+    def _ler_parametros(self) -> List[Tuple[int, int, int]]:
+        """( PARAMS ): devolve (ID, linha, coluna) de cada parâmetro."""
+        parametros = []
+        self._avancar()  # '('
+        while self._tipo_atual() == 'T_TIPO':
+            self._avancar()
+            if self._tipo_atual() != 'T_ID':
+                self._esperar('T_ID')
+                break
+            _, lexema, linha, coluna = self._avancar()
+            parametros.append((int(lexema), linha, coluna))
+            if self._tipo_atual() != ',':
+                break
+            self._avancar()
+        self._esperar(')')
+        return parametros
+
+    # --- Comandos ---
+
+    def _percorrer_comando(self):
+        """
+        Processa um COMANDO com todos os comandos aninhados nele. A profundidade do
+        aninhamento fica na pilha `tarefas`, e não na pilha do Python.
+        """
+        tarefas: List[Tuple[str, Any]] = [('comando', None)]
+        while tarefas:
+            tarefa, dados = tarefas.pop()
+            if tarefa == 'comando':
+                self._comando(tarefas)
+            elif tarefa == 'bloco':
+                # LISTA_COMANDOS: um comando por vez; se ele não consumir nada, o
+                # token é descartado para a leitura sempre avançar
+                if self._tipo_atual() in ('}', 'EOF'):
+                    self._esperar('}')
+                else:
+                    tarefas.append(('bloco_apos_comando', self.posicao))
+                    tarefas.append(('comando', None))
+            elif tarefa == 'bloco_apos_comando':
+                if self.posicao == dados:
+                    self._avancar()
+                tarefas.append(('bloco', None))
+            else:
+                self._continuar_comando(tarefa, dados, tarefas)
+
+    def _abrir_bloco(self, tarefas: List[Tuple[str, Any]]):
+        """BLOCO -> { LISTA_COMANDOS }: consome '{' e agenda os comandos do bloco."""
+        self._avancar()  # '{'
+        tarefas.append(('bloco', None))
+
+    def _ler_salto_de_laco(self):
+        """CMD_BREAK / CMD_CONTINUE: devolve a entrada do laço mais interno, ou None fora de laço."""
+        _, lexema, linha, coluna = self._avancar()
+        self._esperar(';')
+        if not self.lacos_abertos:
+            self.erros.append((f"'{lexema}' fora de um laço", linha, coluna))
+            return None
+        return self.lacos_abertos[-1]
+
+    def _ler_atribuicao(self) -> Optional[Tuple[int, Expressao, int, int]]:
+        """ATRIBUICAO_SIMPLES -> id = EXPRESSAO: devolve (ID, expressão, linha, coluna)."""
+        _, lexema, linha, coluna = self._atual()
+        if not self._esperar('T_ID'):
+            return None
+        self._esperar('=')
+        return int(lexema), self._expressao(), linha, coluna
+
+    def _ler_condicao(self) -> Expressao:
+        """( EXPRESSAO ) dos comandos if/while/do."""
+        self._esperar('(')
+        expressao = self._expressao()
+        self._esperar(')')
+        return expressao
+
+    def _ler_cabecalho_for(self):
+        """
+        for ( ATRIBUICAO_SIMPLES ; EXPRESSAO ; ATRIBUICAO_SIMPLES ): devolve
+        (inicializacao, condicao, passo); partes vazias vêm como None.
+        """
+        self._avancar()  # for
+        self._esperar('(')
+        inicializacao = self._ler_atribuicao() if self._tipo_atual() != ';' else None
+        self._esperar(';')
+        condicao = self._expressao() if self._tipo_atual() != ';' else None
+        self._esperar(';')
+        passo = self._ler_atribuicao() if self._tipo_atual() != ')' else None
+        self._esperar(')')
+        return inicializacao, condicao, passo
+
+    # --- Expressões (precedência de C) ---
+
+    def _operador_binario(self):
+        """(nível, operador) do token atual se ele for um operador binário, senão None."""
+        tipo, lexema, _, _ = self._atual()
+        if tipo == 'T_OP_LOGICO':
+            return NIVEIS_BINARIOS.get(lexema)
+        if tipo == 'T_OP_REL':
+            return NIVEL_RELACIONAL, lexema
+        if tipo == 'T_OP_ARIT':
+            return NIVEIS_BINARIOS.get(lexema)
+        return None
+
+    def _reduzir(self, operandos: List[Expressao], operadores: List[Tuple], nivel_minimo: int, inclusive: bool):
+        """
+        Desempilha os operadores do topo (até o '(' mais recente) com nível maior que
+        `nivel_minimo` (ou igual, se `inclusive`), montando os nós em `operandos`.
+        Uma sequência de operadores n-ários iguais vira um único nó.
+        """
+        while operadores and operadores[-1][0] != '(':
+            nivel, operador = operadores[-1]
+            if nivel < nivel_minimo or (nivel == nivel_minimo and not inclusive):
+                return
+            if operador in OPERADORES_NARIOS:
+                quantidade = 0
+                while operadores and operadores[-1][1] == operador:
+                    operadores.pop()
+                    quantidade += 1
+                lista = operandos[-quantidade - 1:]
+                del operandos[-quantidade - 1:]
+                operandos.append((operador, lista))
+            else:
+                operadores.pop()
+                direita = operandos.pop()
+                operandos.append((operador, operandos.pop(), direita))
+
+    def _expressao(self) -> Expressao:
+        """
+        EXPRESSAO com precedência de C, lida com pilhas explícitas de operandos e
+        operadores (um '(' aberto é uma entrada na pilha de operadores), para que
+        nem parênteses aninhados nem cadeias longas consumam a pilha do Python.
+        """
+        operandos: List[Expressao] = []
+        # Entradas: (nível, operador) ou ('(', operadores unários antes do parêntese)
+        operadores: List[Tuple] = []
+        while True:
+            unarios = self._ler_unarios()
+            if self._tipo_atual() == '(':
+                self._avancar()
+                operadores.append(('(', unarios))
+                continue
+            operando = self._primaria()
+            operandos.append(('unario', unarios, operando) if unarios else operando)
+
+            # Depois de um operando: operador binário, ')' ou fim da expressão
+            while True:
+                binario = self._operador_binario()
+                if binario is not None:
+                    nivel, operador = binario
+                    # Operadores da esquerda de mesma precedência reduzem antes (associatividade
+                    # à esquerda); os n-ários acumulam e '^' fica associativo à direita
+                    self._reduzir(operandos, operadores, nivel, nivel in NIVEIS_ESQUERDA)
+                    if not (nivel == NIVEL_RELACIONAL and operadores and operadores[-1][0] == NIVEL_RELACIONAL):
+                        self._avancar()
+                        operadores.append(binario)
+                        break
+                    # Relacionais não encadeiam: o segundo encerra o nível atual
+
+                self._reduzir(operandos, operadores, 0, True)
+                if not operadores:
+                    return operandos[0]
+                # Fecha o parêntese mais recente; sem ')' o erro fica registrado e a
+                # leitura continua no nível de fora, como na descida recursiva
+                _, unarios_parentese = operadores.pop()
+                self._esperar(')')
+                if unarios_parentese:
+                    operandos.append(('unario', unarios_parentese, operandos.pop()))
+
+    def _ler_unarios(self) -> List[str]:
+        operadores = []
+        while True:
+            tipo, lexema, _, _ = self._atual()
+            if tipo == 'T_OP_LOGICO' and lexema == '!':
+                operadores.append('!')
+            elif tipo == 'T_OP_ARIT' and lexema == '-':
+                operadores.append('neg')
+            else:
+                return operadores
+            self._avancar()
+
+    def _primaria(self) -> Expressao:
+        tipo, lexema, linha, coluna = self._atual()
+
+        if tipo == 'T_ID':
+            self._avancar()
+            nome = self.nomes.get(int(lexema))
+            if nome in CONSTANTES_BOOLEANAS:
+                return ('const', int(CONSTANTES_BOOLEANAS[nome]))
+            return int(lexema)
+
+        if tipo == 'T_NUMERO_INT':
+            self._avancar()
+            return ('const', int(lexema))
+
+        if tipo == 'T_NUMERO_FLOAT':
+            self._avancar()
+            return ('const', float(lexema))
+
+        self.erros.append((f"Expressão inválida em '{lexema}'", linha, coluna))
+        return ('const', 0)
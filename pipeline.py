@@ -1,5 +1,7 @@
 from analisador_lexer import AnalisadorLexico
 from analisador_sint import AnalisadorSintatico
+from analisador_fluxo import AnalisadorFluxo
+from gerador_codigo import GeradorCodigo
 
 def anexar_codigo(arquivo_txt: str, codigo_para_adicionar: str):
     with open(arquivo_txt, 'a', encoding='utf-8') as f:
@@ -45,6 +47,30 @@ def rodar_pipeline(arquivo_txt: str, anexar: str = None):
     else:
         print("Nenhum erro sintático crítico (ou analisador retornou sucesso).")
 
+    # 3) Fluxo de controle e de dados (CFG por função)
+    fluxo = AnalisadorFluxo(tokens, tabela_simbolos)
+    grafos, avisos, erros_fluxo = fluxo.analisar()
+    print(f"\n=== ANÁLISE DE FLUXO ({len(grafos)} funções) ===")
+    if not avisos and not erros_fluxo:
+        print("Nenhum aviso de fluxo.")
+    for msg, ln, col in avisos:
+        print(f"L{ln},C{col}: AVISO: {msg}")
+    for msg, ln, col in erros_fluxo:
+        print(f"L{ln},C{col}: ERRO ESTRUTURAL: {msg}")
+
+    # 4) Código intermediário (três endereços) — só para programas sem erros
+    print("\n=== CÓDIGO INTERMEDIÁRIO ===")
+    if erros_lex or not resultado[0] or erros_fluxo:
+        print("Não gerado: o programa contém erros.")
+        return
+    codigo_ir, erros_ir = GeradorCodigo(tokens, tabela_simbolos).gerar()
+    if erros_ir:
+        print("Não gerado: o gerador encontrou erros.")
+        for msg, ln, col in erros_ir:
+            print(f"L{ln},C{col}: ERRO NA GERAÇÃO: {msg}")
+        return
+    print(codigo_ir.texto())
+
 if __name__ == "__main__":
     arquivo = "codigo.txt"
     codigo_para_adicionar = None